@@ -0,0 +1,119 @@
+"""Soğuk başlangıç ölçümü: modül import süresi ve ilk sayfa (karşılama) render süresi
+
+Kullanım:
+    python benchmarks/startup.py                   # çalışma dizini
+    python benchmarks/startup.py --baseline HEAD~1 # önce/sonra karşılaştırması
+
+Her ölçüm yeni bir Python sürecinde yapılır ve medyan değer raporlanır.
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = 'hotel_simulation.py'
+
+# Uygulamanın modül seviyesindeki import'larını yeni bir süreçte zamanla
+IMPORT_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'pandas': 'pandas' in sys.modules, 'numpy': 'numpy' in sys.modules}}))
+"""
+
+# Karşılama sayfasını AppTest ile ilk kez render et
+RENDER_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'exceptions': len(at.exception)}}))
+"""
+
+
+def top_level_imports(app_path):
+    """Uygulama dosyasındaki modül seviyesindeki import satırları"""
+    with open(app_path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def run_python(code, cwd):
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(root, repeat):
+    """Bir kaynak ağacı için import ve ilk render sürelerini ölç"""
+    imports = '\n'.join(top_level_imports(os.path.join(root, APP_FILE)))
+    import_code = IMPORT_SCRIPT.format(root=root, imports=imports)
+    render_code = RENDER_SCRIPT.format(root=root, app=os.path.join(root, APP_FILE))
+
+    import_runs = [run_python(import_code, root) for _ in range(repeat)]
+    render_runs = [run_python(render_code, root) for _ in range(repeat)]
+    return {
+        'import_seconds': statistics.median(run['seconds'] for run in import_runs),
+        'render_seconds': statistics.median(run['seconds'] for run in render_runs),
+        'pandas_at_startup': import_runs[0]['pandas'],
+        'numpy_at_startup': import_runs[0]['numpy'],
+        'render_exceptions': render_runs[0]['exceptions'],
+    }
+
+
+def checkout(rev, target):
+    """Verilen git revizyonunu geçici bir dizine çıkar"""
+    archive = os.path.join(target, 'tree.tar')
+    subprocess.run(['git', 'archive', '-o', archive, rev], cwd=REPO_ROOT, check=True)
+    with tarfile.open(archive) as tar:
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(target, filter='data')
+        else:
+            tar.extractall(target)
+    os.remove(archive)
+    return target
+
+
+def report(label, result):
+    print(f"{label}:")
+    print(f"  import time        {result['import_seconds'] * 1000:8.1f} ms")
+    print(f"  first render       {result['render_seconds'] * 1000:8.1f} ms")
+    print(f"  pandas at startup  {result['pandas_at_startup']}")
+    print(f"  numpy at startup   {result['numpy_at_startup']}")
+    if result['render_exceptions']:
+        print(f"  render exceptions  {result['render_exceptions']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', help='git revision to compare against (e.g. HEAD~1)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement')
+    args = parser.parse_args()
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as tmp:
+            before = measure(checkout(args.baseline, tmp), args.repeat)
+        report(f"before ({args.baseline})", before)
+
+    after = measure(REPO_ROOT, args.repeat)
+    report("after (working tree)", after)
+
+    if args.baseline:
+        print(f"import speedup       {before['import_seconds'] / after['import_seconds']:8.2f}x")
+        print(f"first render speedup {before['render_seconds'] / after['render_seconds']:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
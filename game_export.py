@@ -0,0 +1,209 @@
+"""Oyun ve geçmiş verilerinin sütunlu dosyalara (Parquet / Arrow IPC) aktarımı"""
+import argparse
+import os
+import sys
+import warnings
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from game_store import TERM_DIR, iter_games
+
+# Karar alanları (st.session_state.decisions ile aynı sırada)
+DECISION_FIELDS = [
+    'walk_in_rate', 'advance_1_rooms', 'advance_2_rooms',
+    'permanent_staff_change', 'temporary_staff', 'staff_salary',
+    'training_budget', 'new_room_batches', 'renovation_budget',
+    'maintenance_budget', 'marketing_budget', 'cost_saving_operations',
+    'cost_saving_admin', 'loan_change', 'credit_term', 'dividend_payout'
+]
+
+# Tur sonucu alanları (game_state['history'] kayıtları)
+RESULT_FIELDS = [
+    'revenue', 'profit', 'occupancy', 'satisfaction', 'market_share', 'share_price'
+]
+
+# Oyun durumu alanları (history hariç game_state)
+STATE_FIELDS = [
+    'cash', 'rooms', 'room_condition', 'permanent_staff', 'temporary_staff',
+    'staff_competence', 'staff_salary', 'long_term_loan', 'total_revenue',
+    'total_costs', 'net_profit', 'occupancy_rate', 'customer_satisfaction',
+    'employee_satisfaction', 'market_share', 'share_price'
+]
+
+ROUNDS_SCHEMA = pa.schema(
+    [('game_id', pa.string()), ('team_name', pa.string()), ('step', pa.int64()),
+     ('round', pa.int64()), ('season', pa.string())] +
+    [(f'decision_{name}', pa.int64()) for name in DECISION_FIELDS] +
+    [(name, pa.float64()) for name in RESULT_FIELDS]
+)
+
+TEAMS_SCHEMA = pa.schema(
+    [('game_id', pa.string()), ('team_name', pa.string()), ('rounds_played', pa.int64()),
+     ('current_round', pa.int64()), ('season', pa.string())] +
+    [(name, pa.float64()) for name in STATE_FIELDS]
+)
+
+FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+DEFAULT_CHUNK_ROWS = 65536
+
+
+class _ChunkedWriter:
+    """Satırları sabit boyutlu parçalar halinde biriktirip dosyaya yazar"""
+
+    def __init__(self, sink, schema, fmt, chunk_rows):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt!r}")
+        self.schema = schema
+        self.chunk_rows = chunk_rows
+        self.columns = {name: [] for name in schema.names}
+        self.pending = 0
+        if fmt == 'parquet':
+            self.writer = pq.ParquetWriter(sink, schema)
+        else:
+            self.writer = ipc.new_file(sink, schema)
+
+    def append(self, row):
+        for name, values in self.columns.items():
+            values.append(row[name])
+        self.pending += 1
+        if self.pending >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        table = pa.Table.from_pydict(self.columns, schema=self.schema)
+        self.writer.write_table(table)
+        for values in self.columns.values():
+            values.clear()
+        self.pending = 0
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def iter_round_rows(game):
+    """Bir oyunun tur bazlı satırlarını (karar + sonuç) üret"""
+    decision_log = game['decision_log']
+    history = game['game_state']['history']
+    if len(decision_log) != len(history):
+        raise ValueError(
+            f"Game {game['game_id']!r}: decision log has {len(decision_log)} entries "
+            f"but history has {len(history)}"
+        )
+    for step, (entry, result) in enumerate(zip(decision_log, history)):
+        row = {
+            'game_id': game['game_id'],
+            'team_name': game['team_name'],
+            'step': step,
+            'round': result['round'],
+            'season': result['season'],
+        }
+        decisions = entry['decisions']
+        for name in DECISION_FIELDS:
+            row[f'decision_{name}'] = decisions[name]
+        for name in RESULT_FIELDS:
+            row[name] = result[name]
+        yield row
+
+
+def team_row(game):
+    """Bir oyunun son durum satırını oluştur"""
+    state = game['game_state']
+    row = {
+        'game_id': game['game_id'],
+        'team_name': game['team_name'],
+        'rounds_played': len(state['history']),
+        'current_round': game['current_round'],
+        'season': game['season'],
+    }
+    for name in STATE_FIELDS:
+        row[name] = state[name]
+    return row
+
+
+def write_rounds(games, sink, fmt='parquet', chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Tur bazlı verileri tek bir dosyaya veya dosya benzeri nesneye yaz"""
+    writer = _ChunkedWriter(sink, ROUNDS_SCHEMA, fmt, chunk_rows)
+    try:
+        for game in games:
+            for row in iter_round_rows(game):
+                writer.append(row)
+    finally:
+        writer.close()
+
+
+def export_games(games, out_dir, fmt='parquet', chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Tüm oyunları tek geçişte rounds.<ext> ve teams.<ext> dosyalarına aktar
+
+    `games` her biri game_id, team_name, current_round, season, game_state
+    ve decision_log anahtarlarını içeren sözlükler üreten herhangi bir
+    iterable olabilir (örn. game_store.iter_games); bellekte en fazla
+    `chunk_rows` satır ve bir oyun tutulur. Tutarsız oyunlar atlanır,
+    uyarı verilir ve (game_id, hata) listesi olarak döndürülür.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt!r}")
+    os.makedirs(out_dir, exist_ok=True)
+    ext = FORMATS[fmt]
+    rounds_path = os.path.join(out_dir, f'rounds{ext}')
+    teams_path = os.path.join(out_dir, f'teams{ext}')
+
+    rounds = _ChunkedWriter(rounds_path, ROUNDS_SCHEMA, fmt, chunk_rows)
+    teams = _ChunkedWriter(teams_path, TEAMS_SCHEMA, fmt, chunk_rows)
+    skipped = []
+    try:
+        for game in games:
+            # Oyunu yazmadan önce tamamen doğrula; yarım oyun yazılmaz
+            try:
+                game_rows = list(iter_round_rows(game))
+                game_team = team_row(game)
+            except (KeyError, TypeError, ValueError) as exc:
+                game_id = game.get('game_id') if isinstance(game, dict) else None
+                warnings.warn(f"Skipping game {game_id!r}: {exc}")
+                skipped.append((game_id, str(exc)))
+                continue
+            for row in game_rows:
+                rounds.append(row)
+            teams.append(game_team)
+    finally:
+        rounds.close()
+        teams.close()
+    return rounds_path, teams_path, skipped
+
+
+def load_export(path):
+    """Aktarılan dosyayı bellek eşlemeli (memory-mapped) olarak geri yükle"""
+    if path.endswith(FORMATS['arrow']):
+        with pa.memory_map(path, 'r') as source:
+            return ipc.open_file(source).read_all()
+    if path.endswith(FORMATS['parquet']):
+        return pq.read_table(path, memory_map=True)
+    raise ValueError(f"Unsupported export file: {path!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export every game in a term directory to columnar files')
+    parser.add_argument('out_dir', help='directory for rounds.<ext> and teams.<ext>')
+    parser.add_argument('--term-dir', default=TERM_DIR, help='directory with saved <game_id>.json files')
+    parser.add_argument('--format', choices=sorted(FORMATS), default='parquet')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    rounds_path, teams_path, skipped = export_games(
+        iter_games(args.term_dir), args.out_dir, args.format, args.chunk_rows
+    )
+    print(rounds_path)
+    print(teams_path)
+    if skipped:
+        print(f"{len(skipped)} games skipped (see warnings above)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
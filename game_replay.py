@@ -0,0 +1,165 @@
+"""Karar geçmişinden oyunların deterministik olarak yeniden oynatılması"""
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from game_store import TERM_DIR, iter_games
+from simulation import initial_game_state, simulate_round
+
+DEFAULT_CHECKPOINT_EVERY = 10
+
+# İlk ayrışma: step = geçmiş indeksi (bir sezon), round/season = o adımın turu ve sezonu,
+# kind = 'history' (sonuçlar farklı), 'length' (kayıt sayısı farklı),
+# 'final_state' (geçmiş aynı, son durum farklı; step = oynanan adım sayısı) veya
+# 'error' (yeniden oynatma hata verdi; detail = hata mesajı)
+Divergence = namedtuple('Divergence', ['step', 'round', 'season', 'kind', 'detail'], defaults=(None,))
+
+SEASONS = ('Summer', 'Winter')
+
+
+class ReplayError(Exception):
+    """Yeniden oynatma belirli bir adımda hata verdi"""
+
+    def __init__(self, step, current_round, season, cause):
+        super().__init__(f"step {step} (round {current_round}, {season}): {cause!r}")
+        self.step = step
+        self.round = current_round
+        self.season = season
+        self.cause = cause
+
+
+class GameReplay:
+    """Bir oyunu karar geçmişinden yeniden kurar
+
+    Her `checkpoint_every` adımda bir durum kaydı tutulur; böylece herhangi
+    bir adıma atlamak en fazla K adım yeniden hesaplama gerektirir. Adım
+    (step) bir sezondur: her tur Summer ve Winter olmak üzere iki adımdır.
+    """
+
+    def __init__(self, decision_log, checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.decision_log = decision_log
+        self.checkpoint_every = checkpoint_every
+        self.checkpoints = []
+        self.history = []
+
+        state = initial_game_state()
+        del state['history']
+        current_round, season = 0, 'Summer'
+        for step, entry in enumerate(decision_log):
+            if step % checkpoint_every == 0:
+                self.checkpoints.append((dict(state), current_round, season))
+            try:
+                state, history_entry, next_round, next_season = simulate_round(
+                    state, entry['decisions'], current_round, season
+                )
+            except Exception as exc:
+                raise ReplayError(step, current_round, season, exc) from exc
+            current_round, season = next_round, next_season
+            self.history.append(history_entry)
+        self.final = (state, current_round, season)
+
+    def __len__(self):
+        return len(self.decision_log)
+
+    def state_at(self, step):
+        """`step` adet adım (sezon) oynandıktan sonraki (durum, tur, sezon) bilgisini döndür"""
+        if not 0 <= step <= len(self):
+            raise IndexError(f"step {step} out of range 0..{len(self)}")
+        if step == len(self):
+            state, current_round, season = self.final
+            return dict(state), current_round, season
+
+        index = step // self.checkpoint_every
+        state, current_round, season = self.checkpoints[index]
+        for entry in self.decision_log[index * self.checkpoint_every:step]:
+            state, _, current_round, season = simulate_round(
+                state, entry['decisions'], current_round, season
+            )
+        return dict(state), current_round, season
+
+    def state_at_round(self, current_round, season='Summer'):
+        """Verilen tur ve sezon oynanmadan hemen önceki durumu döndür
+
+        Oyun 0. tur Summer ile başlar, bu yüzden step = 2 * tur + sezon indeksi.
+        """
+        if season not in SEASONS:
+            raise ValueError(f"Unknown season: {season!r}")
+        return self.state_at(2 * current_round + SEASONS.index(season))
+
+
+def first_divergence(game, checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+    """Kayıtlı oyunun yeniden oynatmadan ilk ayrıldığı noktayı bul
+
+    Tamamen eşleşen oyunlar için None, aksi halde Divergence döndürür.
+    """
+    replay = GameReplay(game['decision_log'], checkpoint_every)
+    recorded = game['game_state']['history']
+
+    for step, (expected, actual) in enumerate(zip(replay.history, recorded)):
+        if any(actual.get(key) != value for key, value in expected.items()):
+            return Divergence(step, expected['round'], expected['season'], 'history')
+    if len(recorded) != len(replay):
+        step = min(len(recorded), len(replay))
+        longer = recorded if len(recorded) > len(replay) else replay.history
+        return Divergence(step, longer[step]['round'], longer[step]['season'], 'length')
+
+    state, current_round, season = replay.final
+    if (current_round != game['current_round'] or season != game['season'] or
+            any(game['game_state'].get(key) != value for key, value in state.items())):
+        return Divergence(len(replay), current_round, season, 'final_state')
+    return None
+
+
+def _verify_one(args):
+    game, checkpoint_every = args
+    game_id, team_name = game.get('game_id'), game.get('team_name')
+    try:
+        divergence = first_divergence(game, checkpoint_every)
+    except ReplayError as exc:
+        divergence = Divergence(exc.step, exc.round, exc.season, 'error', repr(exc.cause))
+    except Exception as exc:
+        divergence = Divergence(None, None, None, 'error', repr(exc))
+    return game_id, team_name, divergence
+
+
+def verify_games(games, checkpoint_every=DEFAULT_CHECKPOINT_EVERY, max_workers=None, chunksize=16):
+    """Bir dönemdeki tüm oyunları paralel olarak doğrula
+
+    Girdi sırasıyla (game_id, team_name, Divergence veya None) listesi döndürür;
+    bir oyundaki hata yalnızca o oyun için kind='error' olarak raporlanır.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            _verify_one,
+            ((game, checkpoint_every) for game in games),
+            chunksize=chunksize
+        )
+        return list(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay every game in a term directory and report divergences')
+    parser.add_argument('--term-dir', default=TERM_DIR, help='directory with saved <game_id>.json files')
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    results = verify_games(iter_games(args.term_dir), args.checkpoint_every, args.workers)
+    divergent = 0
+    for game_id, team_name, divergence in results:
+        if divergence is None:
+            continue
+        divergent += 1
+        line = (f"{game_id}\t{team_name}\tstep {divergence.step} "
+                f"(round {divergence.round}, {divergence.season})\t{divergence.kind}")
+        if divergence.detail:
+            line += f"\t{divergence.detail}"
+        print(line)
+    print(f"{len(results)} games verified, {divergent} divergent")
+    return 1 if divergent else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
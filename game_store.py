@@ -0,0 +1,28 @@
+"""Oyunların dönem (term) dizinine kaydedilmesi ve geri okunması"""
+import glob
+import json
+import os
+
+# Her oturumun oyunu bu dizine <game_id>.json olarak yazılır
+TERM_DIR = os.environ.get(
+    'HOTEL_SIM_TERM_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'games')
+)
+
+
+def save_game(game, term_dir=TERM_DIR):
+    """Oyun kaydını atomik olarak <game_id>.json dosyasına yaz"""
+    os.makedirs(term_dir, exist_ok=True)
+    path = os.path.join(term_dir, f"{game['game_id']}.json")
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(game, f)
+    os.replace(tmp_path, path)
+    return path
+
+
+def iter_games(term_dir=TERM_DIR):
+    """Dönem dizinindeki oyunları tek tek oku (bellekte bir oyun tutulur)"""
+    for path in sorted(glob.glob(os.path.join(term_dir, '*.json'))):
+        with open(path, encoding='utf-8') as f:
+            yield json.load(f)
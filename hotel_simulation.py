@@ -1,7 +1,12 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 from datetime import datetime
+import io
+import os
+import re
+import uuid
+
+from game_store import save_game
+from simulation import initial_game_state, simulate_round
 
 # Sayfa yapılandırması
 st.set_page_config(
@@ -12,42 +17,15 @@ st.set_page_config(
 )
 
 # CSS Styling
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        text-align: center;
-        color: #4F46E5;
-        margin-bottom: 1rem;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-    }
-    .stButton>button {
-        background-color: #4F46E5;
-        color: white;
-        font-weight: bold;
-        border-radius: 8px;
-        padding: 0.5rem 2rem;
-        border: none;
-    }
-    .stButton>button:hover {
-        background-color: #4338CA;
-    }
-    .info-box {
-        background-color: #F3F4F6;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #4F46E5;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    """CSS dosyasını süreç başına bir kez oku"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.css')
+    with open(path, encoding='utf-8') as f:
+        css = f.read()
+    return f'<style>{css}</style>'
+
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Session state başlatma
 if 'game_started' not in st.session_state:
@@ -57,25 +35,7 @@ if 'game_started' not in st.session_state:
     st.session_state.team_name = ''
     
     # Game State
-    st.session_state.game_state = {
-        'cash': 500000,
-        'rooms': 20,
-        'room_condition': 85,
-        'permanent_staff': 15,
-        'temporary_staff': 5,
-        'staff_competence': 70,
-        'staff_salary': 2500,
-        'long_term_loan': 200000,
-        'total_revenue': 0,
-        'total_costs': 0,
-        'net_profit': 0,
-        'occupancy_rate': 0,
-        'customer_satisfaction': 75,
-        'employee_satisfaction': 70,
-        'market_share': 12.5,
-        'share_price': 10.0,
-        'history': []
-    }
+    st.session_state.game_state = initial_game_state()
     
     # Decisions
     st.session_state.decisions = {
@@ -97,6 +57,12 @@ if 'game_started' not in st.session_state:
         'dividend_payout': 0
     }
 
+# Karar geçmişi (her tur için kullanılan kararlar) ve oyun kimliği
+if 'decision_log' not in st.session_state:
+    st.session_state.decision_log = []
+if 'game_id' not in st.session_state:
+    st.session_state.game_id = uuid.uuid4().hex
+
 # Rakip takımlar
 competitors = [
     {'name': 'Team 1', 'market_share': 12.5, 'satisfaction': 75},
@@ -105,110 +71,55 @@ competitors = [
     {'name': 'Team 4', 'market_share': 13.1, 'satisfaction': 76},
 ]
 
+def current_game():
+    """Oturumdaki oyunun dışa aktarılabilir kaydı"""
+    return {
+        'game_id': st.session_state.game_id,
+        'team_name': st.session_state.team_name,
+        'current_round': st.session_state.current_round,
+        'season': st.session_state.season,
+        'game_state': st.session_state.game_state,
+        'decision_log': st.session_state.decision_log
+    }
+
+@st.cache_data(max_entries=64)
+def history_parquet(game_id, steps, _game):
+    """Oyun geçmişini Parquet olarak hazırla (oyun ve tur sayısı başına bir kez)"""
+    from game_export import write_rounds
+    
+    buffer = io.BytesIO()
+    write_rounds([_game], buffer)
+    return buffer.getvalue()
+
 def calculate_results():
     """Tur sonuçlarını hesapla"""
     state = st.session_state.game_state
     dec = st.session_state.decisions
     
-    # Kapasite hesaplamaları
-    total_capacity = state['rooms'] * 180
-    advance_sales = (dec['advance_1_rooms'] + dec['advance_2_rooms']) * 0.4
-    walk_in_sales = total_capacity * 0.5 * (1 - dec['walk_in_rate'] / 200)
-    total_nights_sold = min(advance_sales + walk_in_sales, total_capacity)
-    
-    # Gelir hesaplamaları
-    avg_advance_rate = dec['walk_in_rate'] * 0.8 * (1 - dec['advance_1_rooms'] / 5000)
-    total_revenue = (advance_sales * avg_advance_rate) + (walk_in_sales * dec['walk_in_rate'])
-    
-    # Maliyet hesaplamaları
-    staff_cost = (state['permanent_staff'] * dec['staff_salary'] + dec['temporary_staff'] * 1800) * 6
-    operating_cost = total_nights_sold * 25 * (1 - dec['cost_saving_operations'] / 100)
-    admin_cost = 30000 * (1 - dec['cost_saving_admin'] / 100)
-    total_costs = (staff_cost + operating_cost + admin_cost + 
-                   dec['marketing_budget'] + dec['maintenance_budget'] + 
-                   dec['training_budget'] + (state['long_term_loan'] * 0.03))
-    
-    net_profit = total_revenue - total_costs
-    occupancy_rate = (total_nights_sold / total_capacity) * 100
-    
-    # Memnuniyet skorları
-    satisfaction_score = min(100, max(40, 
-        60 + (state['room_condition'] - 70) * 0.3 + 
-        (state['staff_competence'] - 60) * 0.2 + 
-        (dec['marketing_budget'] / 500) * 0.1 - 
-        (dec['walk_in_rate'] - 100) * 0.15
-    ))
-    
-    employee_satisfaction = min(100, max(40,
-        60 + (dec['staff_salary'] - 2000) / 50 + 
-        (dec['training_budget'] / 500) - 
-        (total_nights_sold / (state['permanent_staff'] + dec['temporary_staff']) - 100) / 10
-    ))
-    
-    # Pazar payı
-    competitiveness = (satisfaction_score + employee_satisfaction) / 2
-    market_share = max(8, min(20, 
-        state['market_share'] * 0.7 + (competitiveness / 10) * 0.3
-    ))
-    
-    # Hisse fiyatı
-    eps = net_profit / 100000
-    share_price = max(5, state['share_price'] * 0.8 + eps * 15)
-    
-    # Oda durumu
-    new_condition = max(40, 
-        state['room_condition'] - 5 + 
-        (dec['maintenance_budget'] / 1000) + 
-        (dec['renovation_budget'] / state['rooms'] / 1000)
+    # Turu hesapla (hata olursa oturum değişmeden kalır)
+    new_state, history_entry, next_round, next_season = simulate_round(
+        state, dec, st.session_state.current_round, st.session_state.season
     )
     
-    # Personel yetkinliği
-    new_competence = min(100, 
-        state['staff_competence'] * 0.95 + (dec['training_budget'] / 1000)
-    )
-    
-    # Yatırımlar
-    investments = dec['new_room_batches'] * 150000 + dec['renovation_budget']
-    new_cash = state['cash'] + net_profit - investments - dec['dividend_payout'] + dec['loan_change']
+    # Kararları kaydet
+    st.session_state.decision_log.append({
+        'round': st.session_state.current_round,
+        'season': st.session_state.season,
+        'decisions': dict(dec)
+    })
     
     # State güncelleme
-    st.session_state.game_state.update({
-        'cash': new_cash,
-        'rooms': state['rooms'] + (dec['new_room_batches'] * 5),
-        'room_condition': new_condition,
-        'permanent_staff': state['permanent_staff'] + dec['permanent_staff_change'],
-        'temporary_staff': dec['temporary_staff'],
-        'staff_competence': new_competence,
-        'staff_salary': dec['staff_salary'],
-        'total_revenue': total_revenue,
-        'total_costs': total_costs,
-        'net_profit': net_profit,
-        'occupancy_rate': occupancy_rate,
-        'customer_satisfaction': satisfaction_score,
-        'employee_satisfaction': employee_satisfaction,
-        'market_share': market_share,
-        'share_price': share_price,
-        'long_term_loan': state['long_term_loan'] + dec['loan_change']
-    })
+    st.session_state.game_state.update(new_state)
     
     # Geçmişe ekle
-    st.session_state.game_state['history'].append({
-        'round': st.session_state.current_round,
-        'season': st.session_state.season,
-        'revenue': total_revenue,
-        'profit': net_profit,
-        'occupancy': occupancy_rate,
-        'satisfaction': satisfaction_score,
-        'market_share': market_share,
-        'share_price': share_price
-    })
+    st.session_state.game_state['history'].append(history_entry)
     
     # Sezon değiştir
-    if st.session_state.season == 'Summer':
-        st.session_state.season = 'Winter'
-    else:
-        st.session_state.season = 'Summer'
-        st.session_state.current_round += 1
+    st.session_state.current_round = next_round
+    st.session_state.season = next_season
+    
+    # Dönem dizinine kaydet
+    save_game(current_game())
 
 def show_welcome_page():
     """Karşılama sayfası"""
@@ -244,6 +155,8 @@ def show_welcome_page():
 
 def show_dashboard():
     """Dashboard sayfası"""
+    import pandas as pd
+    
     state = st.session_state.game_state
     
     # Header
@@ -549,6 +462,8 @@ def show_decisions():
 
 def show_results():
     """Sonuçlar sayfası"""
+    import pandas as pd
+    
     state = st.session_state.game_state
     
     st.markdown(f"## 📊 Round {st.session_state.current_round} Results")
@@ -604,9 +519,24 @@ def show_results():
             }),
             use_container_width=True
         )
+    
+    # Export
+    if len(st.session_state.decision_log) != len(state['history']):
+        st.error("History download is unavailable: this session's decision log is incomplete.")
+    elif len(state['history']) > 0 and st.button("📦 Prepare History Download", use_container_width=True):
+        safe_name = re.sub(r'[^A-Za-z0-9_-]+', '_', st.session_state.team_name).strip('_') or 'team'
+        st.download_button(
+            "⬇️ Download History (Parquet)",
+            data=history_parquet(st.session_state.game_id, len(state['history']), current_game()),
+            file_name=f"{safe_name}_history.parquet",
+            mime="application/octet-stream",
+            use_container_width=True
+        )
 
 def show_competition():
     """Rekabet sayfası"""
+    import pandas as pd
+    
     state = st.session_state.game_state
     
     st.markdown("## 🏆 Market Competition")
@@ -0,0 +1,134 @@
+"""Simülasyon hesaplamaları (Streamlit'ten bağımsız)"""
+
+
+def initial_game_state():
+    """Yeni bir oyunun başlangıç durumu"""
+    return {
+        'cash': 500000,
+        'rooms': 20,
+        'room_condition': 85,
+        'permanent_staff': 15,
+        'temporary_staff': 5,
+        'staff_competence': 70,
+        'staff_salary': 2500,
+        'long_term_loan': 200000,
+        'total_revenue': 0,
+        'total_costs': 0,
+        'net_profit': 0,
+        'occupancy_rate': 0,
+        'customer_satisfaction': 75,
+        'employee_satisfaction': 70,
+        'market_share': 12.5,
+        'share_price': 10.0,
+        'history': []
+    }
+
+
+def simulate_round(state, dec, current_round, season):
+    """Bir turu hesapla
+
+    Girdileri değiştirmez; (yeni durum alanları, geçmiş kaydı, sonraki tur,
+    sonraki sezon) döndürür.
+    """
+    # Kapasite hesaplamaları
+    total_capacity = state['rooms'] * 180
+    advance_sales = (dec['advance_1_rooms'] + dec['advance_2_rooms']) * 0.4
+    walk_in_sales = total_capacity * 0.5 * (1 - dec['walk_in_rate'] / 200)
+    total_nights_sold = min(advance_sales + walk_in_sales, total_capacity)
+
+    # Gelir hesaplamaları
+    avg_advance_rate = dec['walk_in_rate'] * 0.8 * (1 - dec['advance_1_rooms'] / 5000)
+    total_revenue = (advance_sales * avg_advance_rate) + (walk_in_sales * dec['walk_in_rate'])
+
+    # Maliyet hesaplamaları
+    staff_cost = (state['permanent_staff'] * dec['staff_salary'] + dec['temporary_staff'] * 1800) * 6
+    operating_cost = total_nights_sold * 25 * (1 - dec['cost_saving_operations'] / 100)
+    admin_cost = 30000 * (1 - dec['cost_saving_admin'] / 100)
+    total_costs = (staff_cost + operating_cost + admin_cost +
+                   dec['marketing_budget'] + dec['maintenance_budget'] +
+                   dec['training_budget'] + (state['long_term_loan'] * 0.03))
+
+    net_profit = total_revenue - total_costs
+    occupancy_rate = (total_nights_sold / total_capacity) * 100
+
+    # Memnuniyet skorları
+    satisfaction_score = min(100, max(40,
+        60 + (state['room_condition'] - 70) * 0.3 +
+        (state['staff_competence'] - 60) * 0.2 +
+        (dec['marketing_budget'] / 500) * 0.1 -
+        (dec['walk_in_rate'] - 100) * 0.15
+    ))
+
+    # Personel sayısı sıfıra düşebilir; bölmede en az bir kişi say
+    total_staff = max(1, state['permanent_staff'] + dec['temporary_staff'])
+    employee_satisfaction = min(100, max(40,
+        60 + (dec['staff_salary'] - 2000) / 50 +
+        (dec['training_budget'] / 500) -
+        (total_nights_sold / total_staff - 100) / 10
+    ))
+
+    # Pazar payı
+    competitiveness = (satisfaction_score + employee_satisfaction) / 2
+    market_share = max(8, min(20,
+        state['market_share'] * 0.7 + (competitiveness / 10) * 0.3
+    ))
+
+    # Hisse fiyatı
+    eps = net_profit / 100000
+    share_price = max(5, state['share_price'] * 0.8 + eps * 15)
+
+    # Oda durumu
+    new_condition = max(40,
+        state['room_condition'] - 5 +
+        (dec['maintenance_budget'] / 1000) +
+        (dec['renovation_budget'] / state['rooms'] / 1000)
+    )
+
+    # Personel yetkinliği
+    new_competence = min(100,
+        state['staff_competence'] * 0.95 + (dec['training_budget'] / 1000)
+    )
+
+    # Yatırımlar
+    investments = dec['new_room_batches'] * 150000 + dec['renovation_budget']
+    new_cash = state['cash'] + net_profit - investments - dec['dividend_payout'] + dec['loan_change']
+
+    new_state = {
+        'cash': new_cash,
+        'rooms': state['rooms'] + (dec['new_room_batches'] * 5),
+        'room_condition': new_condition,
+        'permanent_staff': state['permanent_staff'] + dec['permanent_staff_change'],
+        'temporary_staff': dec['temporary_staff'],
+        'staff_competence': new_competence,
+        'staff_salary': dec['staff_salary'],
+        'total_revenue': total_revenue,
+        'total_costs': total_costs,
+        'net_profit': net_profit,
+        'occupancy_rate': occupancy_rate,
+        'customer_satisfaction': satisfaction_score,
+        'employee_satisfaction': employee_satisfaction,
+        'market_share': market_share,
+        'share_price': share_price,
+        'long_term_loan': state['long_term_loan'] + dec['loan_change']
+    }
+
+    history_entry = {
+        'round': current_round,
+        'season': season,
+        'revenue': total_revenue,
+        'profit': net_profit,
+        'occupancy': occupancy_rate,
+        'satisfaction': satisfaction_score,
+        'market_share': market_share,
+        'share_price': share_price
+    }
+
+    # Sezon değiştir
+    if season == 'Summer':
+        next_season = 'Winter'
+        next_round = current_round
+    else:
+        next_season = 'Summer'
+        next_round = current_round + 1
+
+    return new_state, history_entry, next_round, next_season